@@ -30,20 +30,13 @@ Dash dashboard with animated solar system background (CSS-based, lightweight)
 - Widgets overlayed on animated background
 - Easily extendable for more widgets and live data
 """
-import dash
-import dash
-from dash import html, dcc, Output, Input, State
-import dash_bootstrap_components as dbc
-import requests
-
-external_stylesheets = [dbc.themes.DARKLY]
-app = dash.Dash(__name__, external_stylesheets=external_stylesheets)
-
-
+import hashlib
 import dash
 from dash import html, dcc, Output, Input, State
 import dash_bootstrap_components as dbc
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 external_stylesheets = [dbc.themes.DARKLY]
 app = dash.Dash(__name__, external_stylesheets=external_stylesheets)
@@ -121,11 +114,21 @@ app.layout = html.Div([
         dcc.Store(id="theme-store", data="solar"),
         dcc.ConfirmDialog(id="trade-alert", message=""),
         dcc.Store(id="last-signal-store", data="-"),
+        dcc.Store(id="payload-hash-store", data=None),
       ], className="mt-4", style={"textAlign": "center"}),
     ], style={"position": "relative", "zIndex": 1}),
   ])
 ], style={"minHeight": "100vh"})
 
+BACKEND_URL = "http://127.0.0.1:8000"
+# Keep-alive connections to the backend are reused across ticks
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+def fetch_dashboard(params):
+  # One consolidated request per tick instead of one per widget; returns the raw body
+  return SESSION.get(f"{BACKEND_URL}/dashboard", params=params).content
+
 # Live data callbacks (replace URLs with your backend endpoints)
 @app.callback(
   Output("balance", "children"),
@@ -137,18 +140,26 @@ app.layout = html.Div([
   Output("trade-alert", "displayed"),
   Output("trade-alert", "message"),
   Output("last-signal-store", "data"),
+  Output("payload-hash-store", "data"),
   Input("interval", "n_intervals"),
   Input("instrument-dropdown", "value"),
-  State("last-signal-store", "data")
+  State("last-signal-store", "data"),
+  State("payload-hash-store", "data")
 )
-def update_dashboard(n, instrument, last_signal):
+def update_dashboard(n, instrument, last_signal, last_hash):
   try:
     # Pass instrument as a query param to backend endpoints (update backend to support this)
     params = {"symbol": instrument}
-    account = requests.get("http://127.0.0.1:8000/account", params=params).json()
-    trades = requests.get("http://127.0.0.1:8000/trades", params=params).json()
-    ml = requests.get("http://127.0.0.1:8000/ml_signal", params=params).json()
-    time_window = requests.get("http://127.0.0.1:8000/time_window", params=params).json()
+    content = fetch_dashboard(params)
+    # Skip re-rendering while the backend keeps returning the same payload
+    payload_hash = hashlib.blake2b(instrument.encode() + b"\0" + content, digest_size=8).hexdigest()
+    if payload_hash == last_hash:
+      return (dash.no_update,) * 10
+    data = orjson.loads(content)
+    account = data["account"]
+    trades = data["trades"]
+    ml = data["ml_signal"]
+    time_window = data["time_window"]
     new_signal = ml.get('signal', '-')
     alert = False
     alert_msg = ""
@@ -164,10 +175,11 @@ def update_dashboard(n, instrument, last_signal):
       trades.get('last', '-'),
       alert,
       alert_msg,
-      new_signal
+      new_signal,
+      payload_hash
     )
   except Exception:
-    return "$0", "0", "0%", "-", "-", "-", False, "", last_signal
+    return "$0", "0", "0%", "-", "-", "-", False, "", last_signal, None
 
 # Theme switcher callback
 @app.callback(
@@ -1,9 +1,15 @@
 # FastAPI backend for ML integration
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-import pandas as pd
+from fastapi import FastAPI, HTTPException, Request, Depends
+import warnings
+import numpy as np
+import orjson
 from ml_trading import MLTradingModel
 
+# /predict passes a bare ndarray whose columns follow ml_model.features, the
+# same order the model was fitted with, so sklearn's missing-feature-names
+# warning is spurious here
+warnings.filterwarnings("ignore", message="X does not have valid feature names", category=UserWarning)
+
 
 app = FastAPI()
 ml_model = MLTradingModel()
@@ -25,21 +31,9 @@ SIM_DATA = {
 }
 from fastapi import Query
 
-# Live dashboard endpoints
-@app.get("/account")
-def get_account(symbol: str = Query("EURUSD")):
-    data = SIM_DATA.get(symbol, SIM_DATA["EURUSD"])
-    return {"balance": data["balance"]}
-
-@app.get("/trades")
-def get_trades(symbol: str = Query("EURUSD")):
-    data = SIM_DATA.get(symbol, SIM_DATA["EURUSD"])
-    return {"open": data["open"], "win_rate": data["win_rate"], "last": data["last"]}
-
 
 # Simulated ML signal with entry, TP, SL for dashboard/EA
-@app.get("/ml_signal")
-def get_ml_signal(symbol: str = Query("EURUSD")):
+def build_ml_signal(symbol):
     data = SIM_DATA.get(symbol, SIM_DATA["EURUSD"])
     # Simulate price and ATR
     price = 20000 if 'US' in symbol else 20.0
@@ -60,13 +54,72 @@ def get_ml_signal(symbol: str = Query("EURUSD")):
         "sl": sl
     }
 
+# SIM_DATA is static, so every response shape is built once at import
+ACCOUNT_RESP = {sym: {"balance": d["balance"]} for sym, d in SIM_DATA.items()}
+TRADES_RESP = {
+    sym: {"open": d["open"], "win_rate": d["win_rate"], "last": d["last"]}
+    for sym, d in SIM_DATA.items()
+}
+ML_SIGNAL_RESP = {sym: build_ml_signal(sym) for sym in SIM_DATA}
+TIME_WINDOW_RESP = {sym: {"status": d["time_window"]} for sym, d in SIM_DATA.items()}
+
+# Live dashboard endpoints
+@app.get("/account")
+def get_account(symbol: str = Query("EURUSD")):
+    return ACCOUNT_RESP.get(symbol, ACCOUNT_RESP["EURUSD"])
+
+@app.get("/trades")
+def get_trades(symbol: str = Query("EURUSD")):
+    return TRADES_RESP.get(symbol, TRADES_RESP["EURUSD"])
+
+@app.get("/ml_signal")
+def get_ml_signal(symbol: str = Query("EURUSD")):
+    # Unknown symbols fall back to EURUSD data but price off their own name
+    resp = ML_SIGNAL_RESP.get(symbol)
+    return resp if resp is not None else build_ml_signal(symbol)
+
 @app.get("/time_window")
 def get_time_window(symbol: str = Query("EURUSD")):
-    data = SIM_DATA.get(symbol, SIM_DATA["EURUSD"])
-    return {"status": data["time_window"]}
+    return TIME_WINDOW_RESP.get(symbol, TIME_WINDOW_RESP["EURUSD"])
 
-class PredictRequest(BaseModel):
-    data: dict  # expects a dict of feature_name: value
+# Everything the dashboard polls, in a single round-trip
+@app.get("/dashboard")
+def get_dashboard(symbol: str = Query("EURUSD")):
+    return {
+        "account": get_account(symbol),
+        "trades": get_trades(symbol),
+        "ml_signal": get_ml_signal(symbol),
+        "time_window": get_time_window(symbol)
+    }
+
+# /predict body is {"data": {feature_name: value}}; decoded straight from
+# bytes with orjson rather than through a Pydantic model. Errors keep the
+# 422 status and the documented body keeps the old PredictRequest shape
+PREDICT_REQUEST_SCHEMA = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {
+                    "title": "PredictRequest",
+                    "type": "object",
+                    "required": ["data"],
+                    "properties": {"data": {"title": "Data", "type": "object"}}
+                }
+            }
+        }
+    }
+}
+
+async def parse_predict_data(request: Request) -> dict:
+    try:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    data = body.get("data") if isinstance(body, dict) else None
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=422, detail="'data' must be an object of feature_name: value")
+    return data
 
 
 # Helper to calculate ATR (Average True Range) for TP/SL
@@ -76,15 +129,35 @@ def calculate_atr(row, period=14, tf='1m'):
         return max(float(row[vol_col]), 0.0001)
     return 0.001
 
-@app.post("/predict")
-def predict(request: PredictRequest):
+# (features, column positions) of the model, rebuilt only when the feature
+# list changes (e.g. after /retrain). Swapped as one tuple so concurrent
+# /predict threads never pair a new feature list with an old index
+_feature_index = (None, {})
+
+def build_feature_vector(data):
+    global _feature_index
+    features, index = _feature_index
+    if features is not ml_model.features:
+        features = ml_model.features
+        index = {f: i for i, f in enumerate(features)}
+        _feature_index = (features, index)
+    # sklearn tree ensembles evaluate in float32; build the row in that dtype
+    # so predict() does not have to copy-convert it
+    X = np.zeros((1, len(features)), dtype=np.float32)
+    for name, value in data.items():
+        i = index.get(name)
+        if i is not None:
+            X[0, i] = value
+    return X
+
+@app.post("/predict", openapi_extra=PREDICT_REQUEST_SCHEMA)
+def predict(data: dict = Depends(parse_predict_data)):
     try:
-        X = pd.DataFrame([request.data])
-        X = X.reindex(columns=ml_model.features, fill_value=0)
+        X = build_feature_vector(data)
         prediction = ml_model.predict(X)
         # Calculate entry, TP, SL based on ATR/volatility
-        price = float(request.data.get('close_1m', 1.0))
-        atr = calculate_atr(request.data, tf='1m')
+        price = float(data.get('close_1m', 1.0))
+        atr = calculate_atr(data, tf='1m')
         direction = int(prediction[0])
         if direction == 1:
             entry = price
@@ -4,9 +4,8 @@ Demonstrates all the enhanced capabilities implemented
 """
 
 import pandas as pd
-import numpy as np
-from datetime import datetime
-import json
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
 
 from enhanced_historical_scanner import EnhancedHistoricalScanner
 from live_trading_module import LiveTradingEngine
@@ -33,9 +32,11 @@ def test_enhanced_historical_scanner():
     
     for symbol, timeframe, file_path in daily_files:
         print(f"\nProcessing {symbol} {timeframe}...")
+        setups_before = len(scanner.setup_outcomes)
         scanner._process_symbol_timeframe(symbol, timeframe, file_path)
-        print(f"  Found {len([s for s in scanner.setup_outcomes if s['symbol'] == symbol])} setups")
-        total_setups += len([s for s in scanner.setup_outcomes if s['symbol'] == symbol])
+        setups_added = len(scanner.setup_outcomes) - setups_before
+        print(f"  Found {setups_added} setups")
+        total_setups += setups_added
     
     print(f"\nTotal setups found: {total_setups}")
     
@@ -89,43 +90,44 @@ def test_live_trading_engine():
     symbols_to_test = ['EURUSD', 'GBPUSD', 'USDJPY']
     timeframes_to_test = ['M15', 'H1', 'D1']
     
-    for symbol in symbols_to_test:
-        for timeframe in timeframes_to_test:
-            data_file = f'data/{symbol}_{timeframe}.csv'
-            try:
-                sample_data = pd.read_csv(data_file)
-                if len(sample_data) > 100:
-                    print(f"\nAnalyzing {symbol} {timeframe} (Live Signal Generation)...")
-                    
-                    result = engine.analyze_real_time_data(symbol, timeframe, sample_data)
-                    
-                    print(f"  Signals Found: {result.get('signal_count', 0)}")
-                    print(f"  Overall Recommendation: {result.get('overall_recommendation', {}).get('action', 'N/A')}")
-                    print(f"  Confidence: {result.get('overall_recommendation', {}).get('confidence', 0):.3f}")
-                    print(f"  Current Price: {result.get('current_price', 0):.5f}")
-                    
-                    market_summary = result.get('market_summary', {})
-                    print(f"  Market Trend: {market_summary.get('trend', 'N/A')}")
-                    print(f"  Volatility: {market_summary.get('volatility', 'N/A')}")
-                    print(f"  Session: {market_summary.get('session', 'N/A')}")
-                    
-                    if result.get('signals'):
-                        top_signal = result['signals'][0]
-                        print(f"  Top Pattern: {top_signal.get('pattern_name', 'N/A')}")
-                        print(f"  Direction: {top_signal.get('direction', 'N/A')}")
-                        print(f"  Entry: {top_signal.get('entry_price', 0):.5f}")
-                        print(f"  Stop Loss: {top_signal.get('stop_loss', 0):.5f}")
-                        print(f"  Risk/Reward: {top_signal.get('risk_reward', 0):.2f}")
-                        
-                        if top_signal.get('execution_advice'):
-                            print(f"  Advice: {top_signal['execution_advice'][0]}")
+    # Load all sample files concurrently; read errors surface per file below
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        sample_files = {
+            (symbol, timeframe): executor.submit(pd.read_csv, f'data/{symbol}_{timeframe}.csv')
+            for symbol, timeframe in product(symbols_to_test, timeframes_to_test)
+        }
+    
+    for (symbol, timeframe), sample_file in sample_files.items():
+        try:
+            sample_data = sample_file.result()
+            if len(sample_data) > 100:
+                print(f"\nAnalyzing {symbol} {timeframe} (Live Signal Generation)...")
+                
+                result = engine.analyze_real_time_data(symbol, timeframe, sample_data)
+                
+                print(f"  Signals Found: {result.get('signal_count', 0)}")
+                print(f"  Overall Recommendation: {result.get('overall_recommendation', {}).get('action', 'N/A')}")
+                print(f"  Confidence: {result.get('overall_recommendation', {}).get('confidence', 0):.3f}")
+                print(f"  Current Price: {result.get('current_price', 0):.5f}")
+                
+                market_summary = result.get('market_summary', {})
+                print(f"  Market Trend: {market_summary.get('trend', 'N/A')}")
+                print(f"  Volatility: {market_summary.get('volatility', 'N/A')}")
+                print(f"  Session: {market_summary.get('session', 'N/A')}")
+                
+                if result.get('signals'):
+                    top_signal = result['signals'][0]
+                    print(f"  Top Pattern: {top_signal.get('pattern_name', 'N/A')}")
+                    print(f"  Direction: {top_signal.get('direction', 'N/A')}")
+                    print(f"  Entry: {top_signal.get('entry_price', 0):.5f}")
+                    print(f"  Stop Loss: {top_signal.get('stop_loss', 0):.5f}")
+                    print(f"  Risk/Reward: {top_signal.get('risk_reward', 0):.2f}")
                     
-                    # Only test first few to avoid too much output
-                    if len([s for s in symbols_to_test if s == symbol]) * len([t for t in timeframes_to_test if t == timeframe]) > 6:
-                        break
-                        
-            except Exception as e:
-                print(f"  Error testing {symbol} {timeframe}: {e}")
+                    if top_signal.get('execution_advice'):
+                        print(f"  Advice: {top_signal['execution_advice'][0]}")
+                
+        except Exception as e:
+            print(f"  Error testing {symbol} {timeframe}: {e}")
     
     return engine
 
@@ -184,50 +186,53 @@ def show_sample_results(scanner):
     
     if scanner.setup_outcomes:
         sample_setup = scanner.setup_outcomes[0]
+        lines = []
+        
+        lines.append(f"\nSample Setup Details:")
+        lines.append(f"Symbol: {sample_setup['symbol']}")
+        lines.append(f"Timeframe: {sample_setup['timeframe']}")
+        lines.append(f"Pattern: {sample_setup['pattern_name']} ({sample_setup['pattern_type']})")
+        lines.append(f"Setup Quality: {sample_setup['setup_quality']}")
+        lines.append(f"Confidence: {sample_setup['confidence']:.3f}")
+        lines.append(f"Direction: {'LONG' if sample_setup.get('is_buy', 1) else 'SHORT'}")
         
-        print(f"\nSample Setup Details:")
-        print(f"Symbol: {sample_setup['symbol']}")
-        print(f"Timeframe: {sample_setup['timeframe']}")
-        print(f"Pattern: {sample_setup['pattern_name']} ({sample_setup['pattern_type']})")
-        print(f"Setup Quality: {sample_setup['setup_quality']}")
-        print(f"Confidence: {sample_setup['confidence']:.3f}")
-        print(f"Direction: {'LONG' if sample_setup.get('is_buy', 1) else 'SHORT'}")
+        lines.append(f"\nEntry/Exit Details:")
+        lines.append(f"Entry Price: {sample_setup['entry_price']:.5f}")
+        lines.append(f"Stop Loss: {sample_setup['stop_loss']:.5f}")
+        lines.append(f"Take Profit 1: {sample_setup['take_profit_1']:.5f}")
+        lines.append(f"Risk/Reward: {sample_setup['risk_reward_ratio']:.2f}")
+        lines.append(f"Position Size: {sample_setup['position_size']:.4f}")
         
-        print(f"\nEntry/Exit Details:")
-        print(f"Entry Price: {sample_setup['entry_price']:.5f}")
-        print(f"Stop Loss: {sample_setup['stop_loss']:.5f}")
-        print(f"Take Profit 1: {sample_setup['take_profit_1']:.5f}")
-        print(f"Risk/Reward: {sample_setup['risk_reward_ratio']:.2f}")
-        print(f"Position Size: {sample_setup['position_size']:.4f}")
+        lines.append(f"\nMulti-Timeframe Context:")
+        lines.append(f"HTF Trend: {sample_setup['htf_trend']}")
+        lines.append(f"LTF Trend: {sample_setup['ltf_trend']}")
+        lines.append(f"Trend Alignment: {sample_setup['trend_alignment']}")
+        lines.append(f"Market Structure: {sample_setup['market_structure']}")
         
-        print(f"\nMulti-Timeframe Context:")
-        print(f"HTF Trend: {sample_setup['htf_trend']}")
-        print(f"LTF Trend: {sample_setup['ltf_trend']}")
-        print(f"Trend Alignment: {sample_setup['trend_alignment']}")
-        print(f"Market Structure: {sample_setup['market_structure']}")
+        lines.append(f"\nMarket Phase Context:")
+        lines.append(f"Trading Session: {sample_setup['trading_session']}")
+        lines.append(f"Week of Month: {sample_setup['week_of_month']}")
+        lines.append(f"Month: {sample_setup['month']}")
+        lines.append(f"Quarter: {sample_setup['quarter']}")
+        lines.append(f"Day of Week: {sample_setup['day_of_week']}")
         
-        print(f"\nMarket Phase Context:")
-        print(f"Trading Session: {sample_setup['trading_session']}")
-        print(f"Week of Month: {sample_setup['week_of_month']}")
-        print(f"Month: {sample_setup['month']}")
-        print(f"Quarter: {sample_setup['quarter']}")
-        print(f"Day of Week: {sample_setup['day_of_week']}")
+        lines.append(f"\nTechnical Context:")
+        lines.append(f"RSI at Entry: {sample_setup['rsi_at_entry']}")
+        lines.append(f"ATR at Entry: {sample_setup['atr_at_entry']:.5f}")
+        lines.append(f"BB Position: {sample_setup['bb_position']}")
+        lines.append(f"MACD Signal: {sample_setup['macd_signal']}")
+        lines.append(f"Volume Ratio: {sample_setup['volume_ratio']}")
         
-        print(f"\nTechnical Context:")
-        print(f"RSI at Entry: {sample_setup['rsi_at_entry']}")
-        print(f"ATR at Entry: {sample_setup['atr_at_entry']:.5f}")
-        print(f"BB Position: {sample_setup['bb_position']}")
-        print(f"MACD Signal: {sample_setup['macd_signal']}")
-        print(f"Volume Ratio: {sample_setup['volume_ratio']}")
+        lines.append(f"\nOutcome (Simulated):")
+        lines.append(f"Trade Outcome: {sample_setup['trade_outcome']}")
+        lines.append(f"Exit Price: {sample_setup['exit_price']:.5f}")
+        lines.append(f"Profit/Loss: {sample_setup['profit_loss']:.5f}")
+        lines.append(f"Time in Trade: {sample_setup['time_in_trade_minutes']} minutes")
+        lines.append(f"Max Favorable: {sample_setup['max_favorable_excursion']:.5f}")
+        lines.append(f"Max Adverse: {sample_setup['max_adverse_excursion']:.5f}")
+        lines.append(f"Setup Success: {sample_setup['setup_success']}")
         
-        print(f"\nOutcome (Simulated):")
-        print(f"Trade Outcome: {sample_setup['trade_outcome']}")
-        print(f"Exit Price: {sample_setup['exit_price']:.5f}")
-        print(f"Profit/Loss: {sample_setup['profit_loss']:.5f}")
-        print(f"Time in Trade: {sample_setup['time_in_trade_minutes']} minutes")
-        print(f"Max Favorable: {sample_setup['max_favorable_excursion']:.5f}")
-        print(f"Max Adverse: {sample_setup['max_adverse_excursion']:.5f}")
-        print(f"Setup Success: {sample_setup['setup_success']}")
+        print("\n".join(lines))
 
 def main():
     """Main test function"""
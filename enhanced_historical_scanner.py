@@ -13,6 +13,7 @@ import pandas as pd
 import numpy as np
 import json
 import glob
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 import logging
@@ -28,6 +29,21 @@ logging.basicConfig(
     ]
 )
 
+# (session, session_phase) for each UTC hour, looked up by _analyze_trading_session
+SESSION_BY_HOUR = (
+    (('asia', 'quiet'),) * 2 + (('asia', 'active'),) * 4 + (('asia', 'quiet'),) * 2 +              # 00-07
+    (('london', 'moderate'),) * 2 + (('london', 'active'),) * 4 + (('london', 'moderate'),) * 2 +  # 08-15
+    (('newyork', 'moderate'),) + (('newyork', 'active'),) * 4 + (('newyork', 'moderate'),) * 3     # 16-23
+)
+
+# Numeric outcome fields read by the post-scan statistics
+OUTCOME_COLUMNS_DTYPE = np.dtype([
+    ('profit_loss', float),
+    ('setup_success', bool),
+    ('time_in_trade_minutes', np.int64),
+    ('tp_level_hit', np.int64)
+])
+
 class EnhancedHistoricalScanner:
     """
     Enhanced scanner that provides comprehensive analysis of historical data
@@ -40,6 +56,7 @@ class EnhancedHistoricalScanner:
         self.scan_results = []
         self.statistics = {}
         self.setup_outcomes = []
+        self._outcome_columns_cache = None
         
         # Configuration
         self.min_confidence = 0.6
@@ -56,10 +73,13 @@ class EnhancedHistoricalScanner:
             'D1': ['W1', 'MN1']
         }
     
-    def scan_historical_data(self) -> Dict:
+    def scan_historical_data(self, max_workers: int = 1) -> Dict:
         """
         Main scanning method that processes all available historical data
         and generates comprehensive analysis.
+        
+        With max_workers > 1 the symbol/timeframe files are scanned in
+        separate processes; results are merged back in file order.
         """
         logging.info("Starting enhanced historical data scan...")
         
@@ -71,9 +91,17 @@ class EnhancedHistoricalScanner:
             return {}
         
         # Process each file
-        for symbol, timeframe, file_path in symbol_tf_files:
-            logging.info(f"Processing {symbol} {timeframe} from {file_path}")
-            self._process_symbol_timeframe(symbol, timeframe, file_path)
+        if max_workers > 1 and len(symbol_tf_files) > 1:
+            symbols, timeframes, file_paths = zip(*symbol_tf_files)
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_scan_worker,
+                                     initargs=(self._scan_settings(),)) as executor:
+                for records in executor.map(_scan_file_in_worker,
+                                            symbols, timeframes, file_paths):
+                    self.scan_results.extend(records)
+                    self.setup_outcomes.extend(records)
+        else:
+            for symbol, timeframe, file_path in symbol_tf_files:
+                self._process_symbol_timeframe(symbol, timeframe, file_path)
         
         # Generate comprehensive analysis
         analysis_results = self._generate_post_scan_analysis()
@@ -84,6 +112,11 @@ class EnhancedHistoricalScanner:
         logging.info("Enhanced historical scan completed")
         return analysis_results
     
+    def _scan_settings(self) -> Dict:
+        """Every attribute except scan results, i.e. what a worker scanner needs"""
+        result_attrs = ('scan_results', 'statistics', 'setup_outcomes', '_outcome_columns_cache')
+        return {name: value for name, value in vars(self).items() if name not in result_attrs}
+    
     def _get_all_data_files(self) -> List[Tuple[str, str, str]]:
         """Get all CSV data files and extract symbol/timeframe information"""
         csv_files = glob.glob(os.path.join(self.data_folder, "*.csv"))
@@ -106,12 +139,20 @@ class EnhancedHistoricalScanner:
     
     def _process_symbol_timeframe(self, symbol: str, timeframe: str, file_path: str):
         """Process a single symbol-timeframe combination"""
+        records = self._scan_symbol_timeframe(symbol, timeframe, file_path)
+        self.scan_results.extend(records)
+        self.setup_outcomes.extend(records)
+    
+    def _scan_symbol_timeframe(self, symbol: str, timeframe: str, file_path: str) -> List[Dict]:
+        """Scan a single symbol-timeframe file and return its setup records with outcomes"""
+        logging.info(f"Processing {symbol} {timeframe} from {file_path}")
+        records = []
         try:
             # Load data
             df = self._load_data_file(file_path)
             if df.empty:
                 logging.warning(f"No data loaded from {file_path}")
-                return
+                return records
             
             df['Symbol'] = symbol
             df['Timeframe'] = timeframe
@@ -131,17 +172,18 @@ class EnhancedHistoricalScanner:
                     setup_record = self._create_comprehensive_setup_record(
                         pattern, df, symbol, timeframe
                     )
-                    self.scan_results.append(setup_record)
                     
                     # Simulate outcome for historical analysis
                     outcome = self._simulate_trade_outcome(pattern, df)
                     setup_record.update(outcome)
-                    self.setup_outcomes.append(setup_record)
+                    records.append(setup_record)
             
             logging.info(f"Processed {symbol} {timeframe}: found {len(patterns)} high-confidence setups")
             
         except Exception as e:
             logging.error(f"Error processing {symbol} {timeframe}: {str(e)}")
+        
+        return records
     
     def _load_data_file(self, file_path: str) -> pd.DataFrame:
         """Load and standardize data file format"""
@@ -420,18 +462,10 @@ class EnhancedHistoricalScanner:
             hour = pd.to_datetime(date).hour
         
         # Simplified session detection (UTC hours)
-        if 0 <= hour < 8:
-            session = 'asia'
-            session_phase = 'active' if 2 <= hour < 6 else 'quiet'
-        elif 8 <= hour < 16:
-            session = 'london'
-            session_phase = 'active' if 10 <= hour < 14 else 'moderate'
-        elif 16 <= hour < 24:
-            session = 'newyork'
-            session_phase = 'active' if 17 <= hour < 21 else 'moderate'
+        if 0 <= hour < 24:
+            session, session_phase = SESSION_BY_HOUR[hour]
         else:
-            session = 'overlap'
-            session_phase = 'very_active'
+            session, session_phase = 'overlap', 'very_active'
         
         return {
             'session': session,
@@ -544,93 +578,61 @@ class EnhancedHistoricalScanner:
             'setup_success': False
         }
         
-        max_favorable = 0
-        max_adverse = 0
-        
-        for i, (_, row) in enumerate(future_data.iterrows()):
-            high = row['High']
-            low = row['Low']
-            
-            # Calculate excursions
-            if pattern.pattern_name in ['Bullish', 'Long', 'Buy'] or 'Bullish' in pattern.pattern_name:
-                # Long trade
-                favorable = high - entry_price
-                adverse = entry_price - low
-                
-                max_favorable = max(max_favorable, favorable)
-                max_adverse = max(max_adverse, adverse)
-                
-                # Check stop loss
-                if low <= stop_loss:
-                    outcome.update({
-                        'trade_outcome': 'stop_loss',
-                        'exit_price': stop_loss,
-                        'exit_reason': 'stop_loss_hit',
-                        'bars_in_trade': i + 1,
-                        'time_in_trade_minutes': i + 1,
-                        'profit_loss': stop_loss - entry_price,
-                        'profit_loss_pct': ((stop_loss - entry_price) / entry_price) * 100
-                    })
-                    break
-                
-                # Check take profits
-                for tp_idx, tp_level in enumerate(take_profits):
-                    if high >= tp_level:
-                        outcome.update({
-                            'trade_outcome': 'take_profit',
-                            'exit_price': tp_level,
-                            'exit_reason': f'tp_{tp_idx + 1}_hit',
-                            'bars_in_trade': i + 1,
-                            'time_in_trade_minutes': i + 1,
-                            'profit_loss': tp_level - entry_price,
-                            'profit_loss_pct': ((tp_level - entry_price) / entry_price) * 100,
-                            'tp_level_hit': tp_idx + 1,
-                            'setup_success': True
-                        })
-                        break
-                
-                if outcome['trade_outcome'] != 'timeout':
-                    break
-            
+        # Check every look-ahead bar at once: the trade exits on the first bar
+        # whose High/Low touches the stop or any target (stop checked first,
+        # then targets in order, as a bar-by-bar walk would)
+        highs = future_data['High'].to_numpy()
+        lows = future_data['Low'].to_numpy()
+        is_long = pattern.pattern_name in ['Bullish', 'Long', 'Buy'] or 'Bullish' in pattern.pattern_name
+        tp_levels = np.asarray(take_profits, dtype=float)
+        
+        if is_long:
+            favorable = highs - entry_price
+            adverse = entry_price - lows
+            sl_hit = lows <= stop_loss
+            tp_hit = highs[:, None] >= tp_levels[None, :]
+        else:
+            favorable = entry_price - lows
+            adverse = highs - entry_price
+            sl_hit = highs >= stop_loss
+            tp_hit = lows[:, None] <= tp_levels[None, :]
+        
+        exit_bar = sl_hit | tp_hit.any(axis=1)
+        exited = exit_bar.any()
+        bars_held = int(np.argmax(exit_bar)) + 1 if exited else len(highs)
+        
+        # fmax skips NaN bars (gappy CSVs), as the running max() of a bar walk did
+        max_favorable = max(0, np.fmax.reduce(favorable[:bars_held], initial=-np.inf))
+        max_adverse = max(0, np.fmax.reduce(adverse[:bars_held], initial=-np.inf))
+        
+        if exited:
+            i = bars_held - 1
+            if sl_hit[i]:
+                profit_loss = stop_loss - entry_price if is_long else entry_price - stop_loss
+                outcome.update({
+                    'trade_outcome': 'stop_loss',
+                    'exit_price': stop_loss,
+                    'exit_reason': 'stop_loss_hit',
+                    'bars_in_trade': bars_held,
+                    'time_in_trade_minutes': bars_held,
+                    'profit_loss': profit_loss,
+                    'profit_loss_pct': (profit_loss / entry_price) * 100
+                })
             else:
-                # Short trade
-                favorable = entry_price - low
-                adverse = high - entry_price
-                
-                max_favorable = max(max_favorable, favorable)
-                max_adverse = max(max_adverse, adverse)
-                
-                # Check stop loss
-                if high >= stop_loss:
-                    outcome.update({
-                        'trade_outcome': 'stop_loss',
-                        'exit_price': stop_loss,
-                        'exit_reason': 'stop_loss_hit',
-                        'bars_in_trade': i + 1,
-                        'time_in_trade_minutes': i + 1,
-                        'profit_loss': entry_price - stop_loss,
-                        'profit_loss_pct': ((entry_price - stop_loss) / entry_price) * 100
-                    })
-                    break
-                
-                # Check take profits
-                for tp_idx, tp_level in enumerate(take_profits):
-                    if low <= tp_level:
-                        outcome.update({
-                            'trade_outcome': 'take_profit',
-                            'exit_price': tp_level,
-                            'exit_reason': f'tp_{tp_idx + 1}_hit',
-                            'bars_in_trade': i + 1,
-                            'time_in_trade_minutes': i + 1,
-                            'profit_loss': entry_price - tp_level,
-                            'profit_loss_pct': ((entry_price - tp_level) / entry_price) * 100,
-                            'tp_level_hit': tp_idx + 1,
-                            'setup_success': True
-                        })
-                        break
-                
-                if outcome['trade_outcome'] != 'timeout':
-                    break
+                tp_idx = int(np.argmax(tp_hit[i]))
+                tp_level = take_profits[tp_idx]
+                profit_loss = tp_level - entry_price if is_long else entry_price - tp_level
+                outcome.update({
+                    'trade_outcome': 'take_profit',
+                    'exit_price': tp_level,
+                    'exit_reason': f'tp_{tp_idx + 1}_hit',
+                    'bars_in_trade': bars_held,
+                    'time_in_trade_minutes': bars_held,
+                    'profit_loss': profit_loss,
+                    'profit_loss_pct': (profit_loss / entry_price) * 100,
+                    'tp_level_hit': tp_idx + 1,
+                    'setup_success': True
+                })
         
         # Update excursions
         outcome['max_favorable_excursion'] = round(max_favorable, 5)
@@ -661,43 +663,73 @@ class EnhancedHistoricalScanner:
             'setup_success': False
         }
     
+    def _outcome_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Numeric outcome fields as parallel arrays (one per field). Reuses the
+        columns of the analysis in progress; otherwise builds them from the
+        current setup_outcomes.
+        """
+        if self._outcome_columns_cache is not None:
+            return self._outcome_columns_cache
+        return self._build_outcome_columns()
+    
+    def _build_outcome_columns(self) -> Dict[str, np.ndarray]:
+        """Read the numeric outcome fields of every setup in a single sweep"""
+        table = np.array(
+            [(s.get('profit_loss', 0), s.get('setup_success', False),
+              s.get('time_in_trade_minutes', 0), s.get('tp_level_hit', 0))
+             for s in self.setup_outcomes],
+            dtype=OUTCOME_COLUMNS_DTYPE
+        )
+        return {name: table[name] for name in OUTCOME_COLUMNS_DTYPE.names}
+    
     def _generate_post_scan_analysis(self) -> Dict:
         """Generate comprehensive post-scan analysis and recommendations"""
         if not self.setup_outcomes:
             return {'error': 'No setups found for analysis'}
         
-        analysis = {
-            'summary_statistics': self._calculate_summary_statistics(),
-            'pattern_performance': self._analyze_pattern_performance(),
-            'timeframe_analysis': self._analyze_timeframe_performance(),
-            'session_analysis': self._analyze_session_performance(),
-            'market_phase_analysis': self._analyze_market_phase_performance(),
-            'trend_alignment_impact': self._analyze_trend_alignment_impact(),
-            'setup_quality_analysis': self._analyze_setup_quality_performance(),
-            'duration_analysis': self._analyze_duration_patterns(),
-            'recommendations': self._generate_recommendations(),
-            'adaptation_signals': self._identify_adaptation_signals()
-        }
+        # Build the outcome columns once for every statistic below; they are
+        # dropped afterwards so later edits to setup_outcomes are always seen
+        self._outcome_columns_cache = self._build_outcome_columns()
+        try:
+            analysis = {
+                'summary_statistics': self._calculate_summary_statistics(),
+                'pattern_performance': self._analyze_pattern_performance(),
+                'timeframe_analysis': self._analyze_timeframe_performance(),
+                'session_analysis': self._analyze_session_performance(),
+                'market_phase_analysis': self._analyze_market_phase_performance(),
+                'trend_alignment_impact': self._analyze_trend_alignment_impact(),
+                'setup_quality_analysis': self._analyze_setup_quality_performance(),
+                'duration_analysis': self._analyze_duration_patterns(),
+                'recommendations': self._generate_recommendations(),
+                'adaptation_signals': self._identify_adaptation_signals()
+            }
+        finally:
+            self._outcome_columns_cache = None
         
         return analysis
     
     def _calculate_summary_statistics(self) -> Dict:
         """Calculate overall summary statistics"""
         total_setups = len(self.setup_outcomes)
-        successful_setups = sum(1 for s in self.setup_outcomes if s.get('setup_success', False))
+        columns = self._outcome_columns()
+        pnl = columns['profit_loss']
+        success = columns['setup_success']
+        durations = columns['time_in_trade_minutes']
         
-        profits = [s.get('profit_loss', 0) for s in self.setup_outcomes if s.get('profit_loss', 0) > 0]
-        losses = [s.get('profit_loss', 0) for s in self.setup_outcomes if s.get('profit_loss', 0) < 0]
+        successful_setups = int(success.sum())
+        profits = pnl[pnl > 0]
+        losses = pnl[pnl < 0]
         
         return {
             'total_setups': total_setups,
             'successful_setups': successful_setups,
             'win_rate': round((successful_setups / total_setups) * 100, 2) if total_setups > 0 else 0,
-            'average_profit': round(np.mean(profits), 4) if profits else 0,
-            'average_loss': round(np.mean(losses), 4) if losses else 0,
-            'profit_factor': round(sum(profits) / abs(sum(losses)), 2) if losses else float('inf'),
-            'total_profit_loss': round(sum(s.get('profit_loss', 0) for s in self.setup_outcomes), 4),
-            'average_time_in_trade': round(np.mean([s.get('time_in_trade_minutes', 0) for s in self.setup_outcomes]), 2),
+            'average_profit': round(profits.mean(), 4) if profits.size else 0,
+            'average_loss': round(losses.mean(), 4) if losses.size else 0,
+            'profit_factor': round(profits.sum() / abs(losses.sum()), 2) if losses.size else float('inf'),
+            'total_profit_loss': round(pnl.sum(), 4),
+            'average_time_in_trade': round(durations.mean(), 2),
             'max_consecutive_wins': self._calculate_max_consecutive_wins(),
             'max_consecutive_losses': self._calculate_max_consecutive_losses()
         }
@@ -850,21 +882,21 @@ class EnhancedHistoricalScanner:
     
     def _analyze_duration_patterns(self) -> Dict:
         """Analyze trade duration patterns"""
-        durations = [s.get('time_in_trade_minutes', 0) for s in self.setup_outcomes]
+        columns = self._outcome_columns()
+        durations = columns['time_in_trade_minutes']
+        success = columns['setup_success']
         
-        if not durations:
+        if not durations.size:
             return {}
         
         return {
-            'average_duration': round(np.mean(durations), 2),
+            'average_duration': round(durations.mean(), 2),
             'median_duration': round(np.median(durations), 2),
-            'min_duration': min(durations),
-            'max_duration': max(durations),
-            'duration_std': round(np.std(durations), 2),
-            'short_duration_wins': sum(1 for s in self.setup_outcomes 
-                                     if s.get('time_in_trade_minutes', 0) < 60 and s.get('setup_success', False)),
-            'long_duration_wins': sum(1 for s in self.setup_outcomes 
-                                    if s.get('time_in_trade_minutes', 0) >= 240 and s.get('setup_success', False))
+            'min_duration': int(durations.min()),
+            'max_duration': int(durations.max()),
+            'duration_std': round(durations.std(), 2),
+            'short_duration_wins': int(np.count_nonzero(success & (durations < 60))),
+            'long_duration_wins': int(np.count_nonzero(success & (durations >= 240)))
         }
     
     def _generate_recommendations(self) -> Dict:
@@ -911,36 +943,24 @@ class EnhancedHistoricalScanner:
     
     def _calculate_max_consecutive_wins(self) -> int:
         """Calculate maximum consecutive wins"""
-        max_wins = 0
-        current_wins = 0
-        
-        for setup in self.setup_outcomes:
-            if setup.get('setup_success', False):
-                current_wins += 1
-                max_wins = max(max_wins, current_wins)
-            else:
-                current_wins = 0
-        
-        return max_wins
+        return self._longest_run(self._outcome_columns()['setup_success'])
     
     def _calculate_max_consecutive_losses(self) -> int:
         """Calculate maximum consecutive losses"""
-        max_losses = 0
-        current_losses = 0
-        
-        for setup in self.setup_outcomes:
-            if not setup.get('setup_success', False):
-                current_losses += 1
-                max_losses = max(max_losses, current_losses)
-            else:
-                current_losses = 0
-        
-        return max_losses
+        return self._longest_run(~self._outcome_columns()['setup_success'])
+    
+    def _longest_run(self, mask: np.ndarray) -> int:
+        """Length of the longest run of True values, via run-length edges"""
+        if not mask.any():
+            return 0
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.astype(np.int8), [0]))))
+        return int((edges[1::2] - edges[::2]).max())
     
     def _generate_risk_management_advice(self) -> List[str]:
         """Generate risk management recommendations"""
-        avg_loss = np.mean([s.get('profit_loss', 0) for s in self.setup_outcomes if s.get('profit_loss', 0) < 0])
-        max_loss = min([s.get('profit_loss', 0) for s in self.setup_outcomes])
+        pnl = self._outcome_columns()['profit_loss']
+        avg_loss = np.mean(pnl[pnl < 0])
+        max_loss = pnl.min()
         
         advice = []
         
@@ -968,9 +988,10 @@ class EnhancedHistoricalScanner:
     
     def _generate_exit_strategy_advice(self) -> List[str]:
         """Generate exit strategy recommendations"""
-        tp_hits = [s.get('tp_level_hit', 0) for s in self.setup_outcomes if s.get('tp_level_hit', 0) > 0]
+        tp_levels = self._outcome_columns()['tp_level_hit']
+        tp_hits = tp_levels[tp_levels > 0]
         
-        if tp_hits and np.mean(tp_hits) < 2:
+        if tp_hits.size and tp_hits.mean() < 2:
             return [
                 "Consider taking partial profits at first target",
                 "Move stop loss to break-even after reaching first target",
@@ -1011,10 +1032,24 @@ class EnhancedHistoricalScanner:
         logging.info(f"Pattern performance saved to {pattern_filename}")
 
 
+# Scanner owned by each worker process of scan_historical_data(max_workers > 1)
+_worker_scanner = None
+
+def _init_scan_worker(settings: Dict):
+    """Build the scanner a worker process reuses for all of its files"""
+    global _worker_scanner
+    _worker_scanner = EnhancedHistoricalScanner(settings['data_folder'])
+    vars(_worker_scanner).update(settings)
+
+def _scan_file_in_worker(symbol: str, timeframe: str, file_path: str) -> List[Dict]:
+    """Scan one file with this process's scanner and return its setup records"""
+    return _worker_scanner._scan_symbol_timeframe(symbol, timeframe, file_path)
+
+
 def main():
     """Main execution function"""
     scanner = EnhancedHistoricalScanner()
-    results = scanner.scan_historical_data()
+    results = scanner.scan_historical_data(max_workers=os.cpu_count() or 1)
     
     if results and 'summary_statistics' in results:
         print("\n" + "="*60)
@@ -145,11 +145,16 @@ class EnhancedPatternDetector:
         """Detect price action patterns like support/resistance breaks, trends, etc."""
         patterns = []
         
+        # Resistance/support of the preceding 20 bars for every bar, computed
+        # once instead of re-slicing the lookback window in each check
+        resistance = df['High'].rolling(window=20, min_periods=1).max().shift(1).to_numpy()
+        support = df['Low'].rolling(window=20, min_periods=1).min().shift(1).to_numpy()
+        
         for i in range(50, len(df) - 1):  # Skip first 50 for context
             current = df.iloc[i]
             
             # Bullish breakout pattern
-            if self._is_bullish_breakout(df, i):
+            if self._is_bullish_breakout(df, i, resistance[i]):
                 patterns.append({
                     'index': i,
                     'type': PatternType.PRICE_ACTION,
@@ -161,7 +166,7 @@ class EnhancedPatternDetector:
                 })
             
             # Bearish breakdown pattern
-            if self._is_bearish_breakdown(df, i):
+            if self._is_bearish_breakdown(df, i, support[i]):
                 patterns.append({
                     'index': i,
                     'type': PatternType.PRICE_ACTION,
@@ -173,7 +178,7 @@ class EnhancedPatternDetector:
                 })
             
             # Support bounce pattern
-            if self._is_support_bounce(df, i):
+            if self._is_support_bounce(df, i, support[i]):
                 patterns.append({
                     'index': i,
                     'type': PatternType.PRICE_ACTION,
@@ -185,7 +190,7 @@ class EnhancedPatternDetector:
                 })
             
             # Resistance rejection pattern
-            if self._is_resistance_rejection(df, i):
+            if self._is_resistance_rejection(df, i, resistance[i]):
                 patterns.append({
                     'index': i,
                     'type': PatternType.PRICE_ACTION,
@@ -346,56 +351,48 @@ class EnhancedPatternDetector:
         
         return patterns
     
-    def _is_bullish_breakout(self, df: pd.DataFrame, idx: int) -> bool:
+    def _is_bullish_breakout(self, df: pd.DataFrame, idx: int, resistance_level: float) -> bool:
         """Check if current candle represents a bullish breakout"""
         current = df.iloc[idx]
-        lookback = df.iloc[max(0, idx-20):idx]
         
-        if lookback.empty:
+        if np.isnan(resistance_level):
             return False
             
-        resistance_level = lookback['High'].max()
         return (current['Close'] > resistance_level and 
                 current['High'] > resistance_level and
                 current['Close'] > current['Open'])  # Bullish candle
     
-    def _is_bearish_breakdown(self, df: pd.DataFrame, idx: int) -> bool:
+    def _is_bearish_breakdown(self, df: pd.DataFrame, idx: int, support_level: float) -> bool:
         """Check if current candle represents a bearish breakdown"""
         current = df.iloc[idx]
-        lookback = df.iloc[max(0, idx-20):idx]
         
-        if lookback.empty:
+        if np.isnan(support_level):
             return False
             
-        support_level = lookback['Low'].min()
         return (current['Close'] < support_level and 
                 current['Low'] < support_level and
                 current['Close'] < current['Open'])  # Bearish candle
     
-    def _is_support_bounce(self, df: pd.DataFrame, idx: int) -> bool:
+    def _is_support_bounce(self, df: pd.DataFrame, idx: int, support_level: float) -> bool:
         """Check if current candle represents a support bounce"""
         if idx < 10:
             return False
             
         current = df.iloc[idx]
         prev = df.iloc[idx-1]
-        lookback = df.iloc[max(0, idx-20):idx]
         
-        support_level = lookback['Low'].min()
         return (prev['Low'] <= support_level * 1.001 and  # Touched support
                 current['Close'] > prev['Close'] and      # Bouncing up
                 current['Close'] > current['Open'])       # Bullish candle
     
-    def _is_resistance_rejection(self, df: pd.DataFrame, idx: int) -> bool:
+    def _is_resistance_rejection(self, df: pd.DataFrame, idx: int, resistance_level: float) -> bool:
         """Check if current candle represents a resistance rejection"""
         if idx < 10:
             return False
             
         current = df.iloc[idx]
         prev = df.iloc[idx-1]
-        lookback = df.iloc[max(0, idx-20):idx]
         
-        resistance_level = lookback['High'].max()
         return (prev['High'] >= resistance_level * 0.999 and  # Touched resistance
                 current['Close'] < prev['Close'] and         # Rejecting down
                 current['Close'] < current['Open'])          # Bearish candle
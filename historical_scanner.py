@@ -144,12 +144,17 @@ def log_setups_to_csv(setups: list, filename: str = "historical_setups_logged.cs
     if not setups:
         return
     import csv
+    from operator import itemgetter
+    fieldnames = list(setups[0].keys())
+    # Every setup comes from the same dict literal in detect_setups, so pull
+    # rows out in header order with one getter instead of DictWriter's per-row
+    # dict-to-fields translation
+    row_values = itemgetter(*fieldnames)
     # Always overwrite the file and write a fresh header for each run
     with open(filename, mode="w", newline="") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=list(setups[0].keys()))
-        writer.writeheader()
-        for s in setups:
-            writer.writerow(s)
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+        writer.writerows(map(row_values, setups))
 
 def notify_backend(setups: list):
     if not setups:
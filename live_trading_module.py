@@ -12,6 +12,9 @@ from typing import Dict, List, Optional, Tuple
 import logging
 from enhanced_pattern_detector import EnhancedPatternDetector, SetupDetails, PatternType
 
+# Trading session for each UTC hour, looked up by _determine_session
+SESSION_BY_HOUR = ('asia',) * 8 + ('london',) * 8 + ('newyork',) * 8
+
 class LiveTradingEngine:
     """
     Real-time pattern recognition engine that matches new market structures 
@@ -231,14 +234,7 @@ class LiveTradingEngine:
     
     def _determine_session(self, hour: int) -> str:
         """Determine current trading session"""
-        if 0 <= hour < 8:
-            return 'asia'
-        elif 8 <= hour < 16:
-            return 'london'
-        elif 16 <= hour < 24:
-            return 'newyork'
-        else:
-            return 'overlap'
+        return SESSION_BY_HOUR[hour] if 0 <= hour < 24 else 'overlap'
     
     def _generate_execution_advice(self, pattern: SetupDetails, 
                                  current_data: pd.DataFrame) -> List[str]:
@@ -5,6 +5,8 @@ try:
     from flask import Flask, request, jsonify, send_file
     import io
     import time
+    from collections import deque
+    from itertools import islice
     from datetime import datetime
     import os
     import numpy as np
@@ -32,8 +34,8 @@ try:
     trade_data = []
     setup_data = []
     ml_data = {}
-    log_entries = []
-    notifications = []
+    log_entries = deque(maxlen=1000)
+    notifications = deque(maxlen=500)
     risk_metrics = {}
     feedback_store = []
 
@@ -114,7 +116,7 @@ try:
 
     @app.route('/log', methods=['GET'])
     def get_logs():
-        return jsonify({'logs': log_entries[-200:]})
+        return jsonify({'logs': list(islice(log_entries, max(0, len(log_entries) - 200), None))})
 
     @app.route('/notify', methods=['POST'])
     def manual_notify():
@@ -2,6 +2,8 @@ from flask import Flask, request, jsonify, send_file
 import io
 import threading
 import time
+from collections import deque
+from itertools import islice
 from datetime import datetime
 import os
 import numpy as np
@@ -19,8 +21,8 @@ from ml_modules import rl_agent, anomaly_detection, meta_learning, model_manager
 trade_data = []         # Executed trades
 setup_data = []         # Detected setups/signals
 ml_data = {}            # ML stats/predictions
-log_entries = []        # Logs
-notifications = []      # Notifications
+log_entries = deque(maxlen=1000)    # Logs (most recent only)
+notifications = deque(maxlen=500)   # Notifications (most recent only)
 risk_metrics = {}       # Risk stats
 
 # --- Core Classes (MLDecisionEngine, Logger, Notifier, etc.) ---
@@ -288,8 +290,8 @@ def stats():
         'setups': setup_data,
         'ml': ml_data,
         'risk': risk_metrics,
-        'logs': log_entries[-100:],
-        'notifications': notifications[-50:]
+        'logs': list(islice(log_entries, max(0, len(log_entries) - 100), None)),
+        'notifications': list(islice(notifications, max(0, len(notifications) - 50), None))
     })
 
 @app.route('/log', methods=['GET'])
@@ -297,7 +299,7 @@ def get_logs():
     # ...existing code...
     pass
 def get_logs():
-    return jsonify({'logs': log_entries[-200:]})
+    return jsonify({'logs': list(islice(log_entries, max(0, len(log_entries) - 200), None))})
 
 @app.route('/notify', methods=['POST'])
 def manual_notify():